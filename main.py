@@ -6,65 +6,139 @@ It provides two chatbot endpoints:
 - MannSahay: calm, professional mental wellness guide
 - MannMitra: fun, light-hearted friend
 
+Each bot is also available as a Server-Sent Events stream at
+/chat/<bot>/stream, which forwards the reply sentence by sentence as
+Ollama generates it.
+Pass ?probe=true to have the stream also report Ollama's status, so the
+frontend can skip the separate /check-offline-status call.
+
+Prometheus metrics (request latency, time-to-first-token, time per output
+token) are exposed at /metrics. Each worker keeps its own metrics, so with
+several workers set PROMETHEUS_MULTIPROC_DIR to an empty directory to
+aggregate them; otherwise a scrape only sees one worker.
+
 To Run:
 1. Make sure Ollama is running:    ollama serve
 2. Pull a model if needed:         ollama pull llama3:8b
-3. Install dependencies:           pip install "fastapi[all]" uvicorn httpx
+3. Install dependencies:           pip install -r requirements.txt
 4. Start the server:               python main.py
 """
 
 import os
+import re
+import asyncio
+import time
+import hashlib
+import logging
 import httpx
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST
 from pydantic import BaseModel
 from typing import List, Optional
 
+from metrics import LLM_TPOT_SECONDS, LLM_TTFT_SECONDS, RequestTimingMiddleware, render_metrics
+from prompts import MANNSAHAY_PROMPT, MANNMITRA_PROMPT
+
 # ---------------------------------------------------------
 # 1. System Prompts
 # ---------------------------------------------------------
 
-MANNSAHAY_PROMPT = """Core Role & Goal
-You are a helpful, clear, and culturally aware AI guide for the youth of India. 
-Your goal is to provide supportive, objective, and actionable guidance to help users navigate their questions and challenges.
+# Prebuilt system messages, shared by every request for the same bot
+MANNSAHAY_SYSTEM = ({"role": "system", "content": MANNSAHAY_PROMPT},)
+MANNMITRA_SYSTEM = ({"role": "system", "content": MANNMITRA_PROMPT},)
 
-Personality: Professional, calm, supportive, clear, and reliable.
-Style: Guiding and informational — structured, clear, polite but not overly casual.
-Interaction: Understand the user's goals and provide structured, practical responses.
 
-Hard Constraints:
-- NEVER say "Aree waah" or "अरे वाह".
-- NEVER give medical diagnoses or therapy.
-- NEVER promise outcomes or personal opinions.
-- Use user's language (Hindi, English, Hinglish, Bangla) — always professional.
+# ---------------------------------------------------------
+# 2. FastAPI setup
+# ---------------------------------------------------------
 
-Safety:
-If distress is detected, mention Indian helplines such as AASRA (+91-9820466726) or iCall (+91-9152987821) calmly and supportively.
-"""
+# Reuse uvicorn's logger so timing lines show up alongside its output
+logger = logging.getLogger("uvicorn.error")
 
-MANNMITRA_PROMPT = """Role & Goal:
-You are a "moj masti" (fun) AI friend. You are here to chat, cheer up, and entertain the user casually and warmly.
+OLLAMA_BASE_URL = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+OLLAMA_MODEL = "llama3:8b"
 
-Tone:
-Playful, witty, and natural. Match the user's vibe (Hinglish, Hindi, or English).
+# How long Ollama keeps the model loaded after a request
+OLLAMA_KEEP_ALIVE = "1h"
 
-Rules:
-- NEVER say "Aree waah" or "अरे वाह".
-- NEVER act as a therapist.
-- Be short, fun, and light-hearted — like a good friend chatting.
-"""
+# At most this many recent turns (user + assistant pairs) are sent to the
+# model; clients still receive the full history. 0 disables trimming.
+MAX_HISTORY_TURNS = int(os.getenv("MAX_HISTORY_TURNS", "16"))
 
+# Old turns are dropped this many at a time, so the history sent to Ollama
+# keeps the same prefix between trims instead of shifting every turn.
+HISTORY_TRIM_TURNS = max(1, MAX_HISTORY_TURNS // 2)
 
-# ---------------------------------------------------------
-# 2. FastAPI setup
-# ---------------------------------------------------------
+# Streamed replies are flushed to the client a sentence at a time
+# (including the Devanagari/Bangla danda), or once the buffer grows too long.
+SENTENCE_END = re.compile(r"[.?!\u0964]\s*$")
+MAX_CHUNK_CHARS = 240
 
-app = FastAPI(title="MannSahay & MannMitra Offline Backend")
+# Keep a warm pool of connections to Ollama so concurrent chats don't pay
+# connection setup on every call. HTTP/2 is negotiated via ALPN when Ollama
+# sits behind a TLS proxy; plain http:// hosts keep using HTTP/1.1 keep-alive.
+OLLAMA_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
 
-OLLAMA_BASE_URL = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+# Fail fast when Ollama is down (short connect/pool waits) while still
+# allowing long generations on slow local hardware.
+OLLAMA_TIMEOUT = httpx.Timeout(180.0, connect=2.0, write=10.0, pool=5.0)
+
+# Streamed replies are abandoned if the first token takes longer than this
+# (seconds), e.g. when prefill is stuck.
+FIRST_TOKEN_TIMEOUT_S = float(os.getenv("FIRST_TOKEN_TIMEOUT_S", "60"))
+
+
+async def warm_up_model(client: httpx.AsyncClient) -> None:
+    """
+    Load the model into Ollama before real traffic arrives, so the first chat
+    doesn't pay the model-load cost. Runs in the background so a slow or
+    unreachable Ollama never blocks startup; failures are only logged.
+    """
+    try:
+        await client.post("/api/chat", json={
+            "model": OLLAMA_MODEL,
+            "messages": [{"role": "user", "content": "ping"}],
+            "stream": False,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {"num_predict": 1}
+        })
+    except Exception:
+        logger.warning("Ollama model warm-up failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the shared Ollama HTTP client for the lifetime of the app."""
+    # Shared HTTP client with higher timeout for local CPU inference.
+    # Created here (not at import) so it binds to the server's event loop.
+    app.state.client = httpx.AsyncClient(
+        base_url=OLLAMA_BASE_URL,
+        http2=True,
+        timeout=OLLAMA_TIMEOUT,
+        limits=OLLAMA_LIMITS
+    )
+    warm_up = asyncio.create_task(warm_up_model(app.state.client))
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await app.state.client.aclose()
+
+
+# JSON endpoints rely on FastAPI serializing the response_model directly;
+# orjson is only used for the hand-built SSE events.
+app = FastAPI(title="MannSahay & MannMitra Offline Backend", lifespan=lifespan)
 
-# Shared HTTP client with higher timeout for local CPU inference
-client = httpx.AsyncClient(base_url=OLLAMA_BASE_URL, timeout=180.0)
+# Compress larger JSON replies (long Hindi/Bangla histories compress well).
+# Starlette skips text/event-stream, so the SSE endpoints stay unbuffered.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(RequestTimingMiddleware)
 
 
 # ---------------------------------------------------------
@@ -81,29 +155,116 @@ class ChatRequest(BaseModel):
 
 class ChatResponse(BaseModel):
     reply: Optional[str] = None
-    new_history: Optional[List[Message]] = None
+    # Plain role/content dicts, so replies skip re-validating every turn
+    new_history: Optional[List[dict]] = None
     error: Optional[str] = None
 
 
 # ---------------------------------------------------------
-# 4. Helper Function for Ollama Interaction
+# 4. Reply Cache
 # ---------------------------------------------------------
 
-async def get_ollama_response(system_prompt: str, history: List[Message], user_message_content: str) -> dict:
+class ReplyCache:
+    """
+    Small in-memory LRU cache of model replies, so repeated openers
+    ("hi", "namaste") skip the LLM entirely. Entries expire after `ttl`
+    seconds. Each worker process keeps its own cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        reply, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return reply
+
+    def put(self, key: bytes, reply: str) -> None:
+        self._entries[key] = (reply, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def reply_cache_key(system_messages: tuple, history_dicts: List[dict], user_message_content: str) -> bytes:
+    """Hash the full conversation (system prompt, history, new message) into a cache key."""
+    parts = [msg["content"] for msg in system_messages]
+    parts.extend(f"{msg['role']}:{msg['content']}" for msg in history_dicts)
+    parts.append(user_message_content)
+    # surrogatepass: valid JSON may carry lone surrogates, and hashing must never fail a request
+    return hashlib.blake2b("\0".join(parts).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+# Only MannSahay caches replies; MannMitra banter should stay fresh
+MANNSAHAY_CACHE = ReplyCache()
+
+
+# ---------------------------------------------------------
+# 5. Helper Function for Ollama Interaction
+# ---------------------------------------------------------
+
+def history_to_dicts(history: List[Message]) -> List[dict]:
+    """Convert validated history into plain role/content dicts once per request."""
+    return [{"role": msg.role, "content": msg.content} for msg in history]
+
+
+def build_ollama_messages(system_messages: tuple, history_dicts: List[dict], new_user_message: dict) -> List[dict]:
+    """
+    Build the message list sent to Ollama.
+
+    Ollama reuses the KV cache for the longest prompt prefix it has already
+    seen, so the system prompt and history must serialize byte-identically
+    on every turn. Callers pass dicts built by history_to_dicts (role before
+    content) rather than Pydantic dumps to keep that layout fixed.
+
+    Once history exceeds MAX_HISTORY_TURNS turns, the oldest turns are
+    dropped in blocks of HISTORY_TRIM_TURNS. Prefill cost stays bounded, and
+    the trimmed history keeps a stable prefix until the next block is dropped,
+    so prefix reuse only resets once per block rather than on every turn.
+    """
+    if MAX_HISTORY_TURNS > 0:
+        excess = len(history_dicts) - 2 * MAX_HISTORY_TURNS
+        if excess > 0:
+            block = 2 * HISTORY_TRIM_TURNS
+            history_dicts = history_dicts[-(-excess // block) * block:]
+
+    # Single exact-size allocation instead of extend/append resizes
+    return [*system_messages, *history_dicts, new_user_message]
+
+
+async def get_ollama_response(client: httpx.AsyncClient, system_messages: tuple, history: List[Message], user_message_content: str, cache: Optional[ReplyCache] = None) -> dict:
     """
     Send conversation to Ollama and return the model's reply.
+    If a cache is given, a previously seen conversation is answered from it.
     """
 
-    # Build full message list
-    new_user_message = Message(role="user", content=user_message_content)
-    ollama_messages = [{"role": "system", "content": system_prompt}]
-    ollama_messages.extend([msg.dict() for msg in history])
-    ollama_messages.append(new_user_message.dict())
+    history_dicts = history_to_dicts(history)
+    new_user_message = {"role": "user", "content": user_message_content}
+
+    cache_key = None
+    if cache is not None:
+        cache_key = reply_cache_key(system_messages, history_dicts, user_message_content)
+        reply_text = cache.get(cache_key)
+        if reply_text is not None:
+            new_bot_message = {"role": "assistant", "content": reply_text}
+            updated_history = history_dicts + [new_user_message, new_bot_message]
+            return {"reply": reply_text, "new_history": updated_history, "error": None}
+
+    ollama_messages = build_ollama_messages(system_messages, history_dicts, new_user_message)
 
     request_body = {
-        "model": "llama3:8b",
+        "model": OLLAMA_MODEL,
         "messages": ollama_messages,
-        "stream": False
+        "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE
     }
 
     try:
@@ -114,73 +275,333 @@ async def get_ollama_response(system_prompt: str, history: List[Message], user_m
 
         # Some Ollama versions return {"message": {"content": "..."}}
         # others return {"response": "..."} → handle both safely
+        from_model = True
         if "message" in data and "content" in data["message"]:
             reply_text = data["message"]["content"]
         elif "response" in data:
             reply_text = data["response"]
         else:
             reply_text = str(data)
+            from_model = False
 
         # Add AI message to chat history
-        new_bot_message = Message(role="assistant", content=reply_text)
-        updated_history = history + [new_user_message, new_bot_message]
+        new_bot_message = {"role": "assistant", "content": reply_text}
+        updated_history = history_dicts + [new_user_message, new_bot_message]
+
+        # Never replay a stringified unexpected payload as a real reply
+        if cache is not None and from_model and reply_text:
+            cache.put(cache_key, reply_text)
 
         return {"reply": reply_text, "new_history": updated_history, "error": None}
 
-    except httpx.ConnectError:
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         return {
             "reply": None,
-            "new_history": history,
+            "new_history": history_dicts,
             "error": "Offline AI server not reachable. Please ensure Ollama is running."
         }
 
     except httpx.HTTPStatusError as e:
         return {
             "reply": None,
-            "new_history": history,
+            "new_history": history_dicts,
             "error": f"Ollama error {e.response.status_code}: {e.response.text}"
         }
 
     except Exception as e:
         return {
             "reply": None,
-            "new_history": history,
+            "new_history": history_dicts,
             "error": f"Unexpected error: {str(e)}"
         }
 
 
+def sse_event(payload: dict) -> bytes:
+    """Format a payload as a single Server-Sent Events message."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+class OllamaStreamError(Exception):
+    """Ollama reported an error, or cut off, partway through a streamed reply."""
+
+
+async def iter_ndjson(response: httpx.Response):
+    """
+    Parse Ollama's newline-delimited JSON stream straight from the raw bytes,
+    skipping the str decode and line buffering of aiter_lines().
+    """
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        buf += chunk
+        start = 0
+        while (nl := buf.find(b"\n", start)) != -1:
+            line = buf[start:nl]
+            start = nl + 1
+            if line.strip():
+                yield orjson.loads(line)
+        del buf[:start]
+
+    if buf.strip():
+        yield orjson.loads(buf)
+
+
+async def ollama_is_online(client: httpx.AsyncClient) -> bool:
+    """Cheap status probe against Ollama's /api/tags."""
+    try:
+        response = await client.get("/api/tags")
+        return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+async def close_chat(chat_task: Optional[asyncio.Task], response: Optional[httpx.Response]) -> None:
+    """Abandon a streaming chat request, closing its connection to Ollama."""
+    if response is not None:
+        await response.aclose()
+    elif chat_task is None:
+        return
+    elif not chat_task.done():
+        chat_task.cancel()
+    elif not chat_task.cancelled() and chat_task.exception() is None:
+        await chat_task.result().aclose()
+
+
+async def stream_ollama_response(raw: Request, client: httpx.AsyncClient, system_messages: tuple, history: List[Message], user_message_content: str, cache: Optional[ReplyCache] = None, probe: bool = False):
+    """
+    Stream the model's reply from Ollama as SSE events.
+
+    The first piece of content is sent as soon as it arrives to keep
+    time-to-first-token low. After that, {"chunk": "..."} is emitted each
+    time a sentence completes (or the buffer reaches MAX_CHUNK_CHARS), and a
+    final {"done": true, "reply": ..., "new_history": [...]} event once the
+    stream completes. Errors, including ones Ollama reports mid-stream, are
+    reported as a single {"error": "..."} event and no final event is sent.
+    Cache hits are sent as one chunk followed by the final event.
+
+    If the browser disconnects mid-reply, the Ollama stream is closed, which
+    makes Ollama abort the generation instead of finishing it for nobody.
+
+    With probe=True, Ollama's /api/tags is checked while the chat request is
+    already in flight, and the first event is always {"status": "online"} or
+    {"status": "offline"}. An offline probe abandons the chat, except on a
+    cache hit, which is still served.
+
+    If no token arrives within FIRST_TOKEN_TIMEOUT_S, an error event is sent
+    and the Ollama request is closed.
+    """
+
+    history_dicts = history_to_dicts(history)
+    new_user_message = {"role": "user", "content": user_message_content}
+
+    cache_key = None
+    if cache is not None:
+        cache_key = reply_cache_key(system_messages, history_dicts, user_message_content)
+        reply_text = cache.get(cache_key)
+        if reply_text is not None:
+            if probe:
+                online = await ollama_is_online(client)
+                yield sse_event({"status": "online" if online else "offline"})
+            new_bot_message = {"role": "assistant", "content": reply_text}
+            yield sse_event({"chunk": reply_text})
+            yield sse_event({
+                "done": True,
+                "reply": reply_text,
+                "new_history": history_dicts + [new_user_message, new_bot_message]
+            })
+            return
+
+    ollama_messages = build_ollama_messages(system_messages, history_dicts, new_user_message)
+
+    request_body = {
+        "model": OLLAMA_MODEL,
+        "messages": ollama_messages,
+        "stream": True,
+        "keep_alive": OLLAMA_KEEP_ALIVE
+    }
+
+    tokens = []
+    buf = ""
+    first_sent = False
+    finished = False
+    t0 = last_token_at = time.perf_counter()
+    deadline = t0 + FIRST_TOKEN_TIMEOUT_S
+
+    chat_task = None
+    response = None
+
+    try:
+        # Send the chat right away so the optional probe overlaps with it
+        chat_request = client.build_request("POST", "/api/chat", json=request_body)
+        chat_task = asyncio.create_task(client.send(chat_request, stream=True))
+
+        if probe:
+            if not await ollama_is_online(client):
+                yield sse_event({"status": "offline"})
+                raise httpx.ConnectError("Ollama status probe failed")
+            yield sse_event({"status": "online"})
+
+        # Ollama only sends headers with the first token, so the first-token
+        # deadline covers both the response and the first NDJSON item
+        response = await asyncio.wait_for(chat_task, deadline - time.perf_counter())
+        if response.status_code >= 400:
+            await response.aread()
+            response.raise_for_status()
+
+        # Ollama streams newline-delimited JSON objects, one per token
+        items = iter_ndjson(response)
+        while True:
+            next_item = anext(items, None)
+            if not first_sent:
+                next_item = asyncio.wait_for(next_item, deadline - time.perf_counter())
+            data = await next_item
+            if data is None:
+                break
+
+            if await raw.is_disconnected():
+                # Closing the response drops the connection to Ollama
+                logger.info("client disconnected, cancelling generation")
+                return
+
+            # Mid-stream failures arrive as an error line on a 200 response
+            if data.get("error"):
+                raise OllamaStreamError(data["error"])
+
+            if "message" in data:
+                delta = data["message"].get("content", "")
+            else:
+                delta = data.get("response", "")
+
+            if delta and not first_sent:
+                # Bypass the sentence buffer for the very first token
+                first_sent = True
+                tokens.append(delta)
+                last_token_at = time.perf_counter()
+                LLM_TTFT_SECONDS.observe(last_token_at - t0)
+                logger.info("first_token_ms=%.1f", (last_token_at - t0) * 1000)
+                yield sse_event({"chunk": delta})
+            elif delta:
+                now = time.perf_counter()
+                LLM_TPOT_SECONDS.observe(now - last_token_at)
+                last_token_at = now
+                tokens.append(delta)
+                buf += delta
+                if SENTENCE_END.search(buf) or len(buf) > MAX_CHUNK_CHARS:
+                    yield sse_event({"chunk": buf})
+                    buf = ""
+
+            if data.get("done"):
+                finished = True
+                break
+
+        if not finished:
+            raise OllamaStreamError("stream ended before the reply was complete")
+
+        # Flush whatever is left of the last sentence
+        if buf:
+            yield sse_event({"chunk": buf})
+
+        # Add AI message to chat history once the stream has closed
+        reply_text = "".join(tokens)
+        new_bot_message = {"role": "assistant", "content": reply_text}
+        updated_history = history_dicts + [new_user_message, new_bot_message]
+
+        # Only complete, non-empty replies are worth replaying
+        if cache is not None and reply_text:
+            cache.put(cache_key, reply_text)
+
+        yield sse_event({
+            "done": True,
+            "reply": reply_text,
+            "new_history": updated_history
+        })
+
+    except (httpx.ConnectError, httpx.ConnectTimeout):
+        yield sse_event({"error": "Offline AI server not reachable. Please ensure Ollama is running."})
+
+    except TimeoutError:
+        yield sse_event({"error": f"No response from the offline AI within {FIRST_TOKEN_TIMEOUT_S:g}s. Please try again."})
+
+    except httpx.HTTPStatusError as e:
+        yield sse_event({"error": f"Ollama error {e.response.status_code}: {e.response.text}"})
+
+    except OllamaStreamError as e:
+        yield sse_event({"error": f"Ollama error: {e}"})
+
+    except Exception as e:
+        yield sse_event({"error": f"Unexpected error: {str(e)}"})
+
+    finally:
+        await close_chat(chat_task, response)
+
+
 # ---------------------------------------------------------
-# 5. Chat Endpoints
+# 6. Chat Endpoints
 # ---------------------------------------------------------
 
 @app.post("/chat/mannsahay", response_model=ChatResponse)
-async def chat_mannsahay(request: ChatRequest):
+async def chat_mannsahay(request: ChatRequest, raw: Request):
     """Supportive guide bot"""
     return await get_ollama_response(
-        system_prompt=MANNSAHAY_PROMPT,
+        client=raw.app.state.client,
+        system_messages=MANNSAHAY_SYSTEM,
         history=request.history,
-        user_message_content=request.user_message
+        user_message_content=request.user_message,
+        cache=MANNSAHAY_CACHE
     )
 
 
 @app.post("/chat/mannmitra", response_model=ChatResponse)
-async def chat_mannmitra(request: ChatRequest):
+async def chat_mannmitra(request: ChatRequest, raw: Request):
     """Moj masti friend bot"""
     return await get_ollama_response(
-        system_prompt=MANNMITRA_PROMPT,
+        client=raw.app.state.client,
+        system_messages=MANNMITRA_SYSTEM,
         history=request.history,
         user_message_content=request.user_message
     )
 
 
+@app.post("/chat/mannsahay/stream")
+async def chat_mannsahay_stream(request: ChatRequest, raw: Request, probe: bool = False):
+    """Supportive guide bot, streamed sentence-by-sentence over SSE"""
+    return StreamingResponse(
+        stream_ollama_response(
+            raw=raw,
+            client=raw.app.state.client,
+            system_messages=MANNSAHAY_SYSTEM,
+            history=request.history,
+            user_message_content=request.user_message,
+            cache=MANNSAHAY_CACHE,
+            probe=probe
+        ),
+        media_type="text/event-stream"
+    )
+
+
+@app.post("/chat/mannmitra/stream")
+async def chat_mannmitra_stream(request: ChatRequest, raw: Request, probe: bool = False):
+    """Moj masti friend bot, streamed sentence-by-sentence over SSE"""
+    return StreamingResponse(
+        stream_ollama_response(
+            raw=raw,
+            client=raw.app.state.client,
+            system_messages=MANNMITRA_SYSTEM,
+            history=request.history,
+            user_message_content=request.user_message,
+            probe=probe
+        ),
+        media_type="text/event-stream"
+    )
+
+
 # ---------------------------------------------------------
-# 6. Status Check Endpoint
+# 7. Status Check Endpoint
 # ---------------------------------------------------------
 
 @app.get("/check-offline-status")
-async def check_ollama_status():
+async def check_ollama_status(raw: Request):
     try:
-        resp = await client.get("/api/tags")
+        resp = await raw.app.state.client.get("/api/tags")
         if resp.status_code == 200:
             return {"status": "online"}
         return {"status": "offline", "details": resp.text}
@@ -189,10 +610,28 @@ async def check_ollama_status():
 
 
 # ---------------------------------------------------------
-# 7. Run Server
+# 8. Metrics Endpoint
+# ---------------------------------------------------------
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+# ---------------------------------------------------------
+# 9. Run Server
 # ---------------------------------------------------------
 
 if __name__ == "__main__":
     print("🚀 Starting MannSahay & MannMitra Backend...")
     print("Access the docs at http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools come with uvicorn[standard]; the app is passed as an
+    # import string so uvicorn can spawn worker processes.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4"))
+    )
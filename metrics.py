@@ -0,0 +1,62 @@
+"""
+Prometheus metrics for the MannSahay & MannMitra backend.
+
+The metrics live in their own module so they are registered exactly once per
+process. `python main.py` loads main.py twice (as __main__ and again as
+main:app), which would otherwise register every metric twice.
+
+Each worker process records its own metrics. By default a scrape of /metrics
+therefore only shows the worker that answered it. To aggregate across
+workers, point PROMETHEUS_MULTIPROC_DIR at an empty directory before the
+server starts (the Docker image does this).
+"""
+
+import os
+import time
+
+from prometheus_client import CollectorRegistry, Histogram, generate_latest, multiprocess
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling an HTTP request, including streamed bodies",
+    ["method", "route"]
+)
+LLM_TTFT_SECONDS = Histogram(
+    "llm_ttft_seconds",
+    "Time from sending a streamed chat to Ollama until its first token",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+)
+LLM_TPOT_SECONDS = Histogram(
+    "llm_tpot_seconds",
+    "Time between consecutive streamed tokens from Ollama",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+)
+
+
+class RequestTimingMiddleware:
+    """Record the duration of every HTTP request, labelled by matched route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Label by route template, not raw path, to keep cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> bytes:
+    """Render all metrics in the Prometheus text format, merged across workers when enabled."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()